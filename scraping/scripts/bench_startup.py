@@ -0,0 +1,183 @@
+"""Measure CLI startup cost per command using ``python -X importtime``.
+
+Each command is run once to warm the sources snapshot, then ``--runs`` times
+with ``-X importtime``. ``dry-run`` uses a temporary sources file with one
+enabled source and no endpoints, so it imports the pipeline without making
+any requests. Results are appended as JSON lines to
+``output/metrics/startup.jsonl`` so startup regressions can be tracked
+alongside run metrics.
+
+    python scripts/bench_startup.py --runs 5
+    python scripts/bench_startup.py --max-import-ms 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+COMMANDS: dict[str, list[str]] = {
+    "help": ["--help"],
+    "list-sources": ["--list-sources", "--include-disabled", "--allow-unverified"],
+    "dry-run": ["--dry-run"],
+}
+
+# Commands that run against a single enabled source with no endpoints.
+USES_BENCH_SOURCES = {"dry-run"}
+BENCH_SOURCES = {
+    "sources": [
+        {
+            "name": "startup_bench",
+            "type": "http_html",
+            "base_url": "https://example.invalid",
+            "enabled": True,
+            "reputation": "reputable",
+            "endpoints": [],
+        }
+    ]
+}
+
+WATCHED_MODULES = ("pydantic", "requests", "urllib3", "bs4", "selectolax")
+
+
+def _parse_importtime(stderr: str) -> tuple[int, dict[str, int]]:
+    """Return total top-level import time and cumulative time per module (us)."""
+    total_us = 0
+    modules: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|", 2)
+        module = name.strip()
+        cumulative_us = int(cumulative.strip())
+        modules[module] = max(modules.get(module, 0), cumulative_us)
+        if not name[1:].startswith(" "):
+            total_us += cumulative_us
+    return total_us, modules
+
+
+def _run(args: list[str], env: dict[str, str]) -> tuple[float, str]:
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "apexhq_scraper", *args],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    if completed.returncode != 0:
+        raise RuntimeError(
+            f"apexhq_scraper {' '.join(args)} exited with {completed.returncode}:\n"
+            + "\n".join(
+                line
+                for line in completed.stderr.splitlines()
+                if not line.startswith("import time:")
+            )
+        )
+    return elapsed_ms, completed.stderr
+
+
+def bench_command(name: str, args: list[str], runs: int, env: dict[str, str]) -> dict:
+    _run(args, env)
+    wall_ms: list[float] = []
+    import_ms: list[float] = []
+    loaded: set[str] = set()
+    for _ in range(runs):
+        elapsed_ms, stderr = _run(args, env)
+        total_us, modules = _parse_importtime(stderr)
+        wall_ms.append(elapsed_ms)
+        import_ms.append(total_us / 1000.0)
+        loaded.update(m for m in WATCHED_MODULES if m in modules)
+    return {
+        "command": name,
+        "args": args,
+        "runs": runs,
+        "wall_ms_median": round(statistics.median(wall_ms), 2),
+        "import_ms_median": round(statistics.median(import_ms), 2),
+        "heavy_modules": sorted(loaded),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark apexhq-scraper startup")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--commands", help="Comma-separated subset of commands")
+    parser.add_argument(
+        "--output", default=str(ROOT / "output" / "metrics" / "startup.jsonl")
+    )
+    parser.add_argument("--no-write", action="store_true")
+    parser.add_argument(
+        "--max-import-ms",
+        type=float,
+        help="Exit non-zero if any command's median import time exceeds this",
+    )
+    args = parser.parse_args()
+
+    selected = COMMANDS
+    if args.commands:
+        names = [item.strip() for item in args.commands.split(",") if item.strip()]
+        unknown = [name for name in names if name not in COMMANDS]
+        if unknown:
+            parser.error(
+                f"unknown command(s): {', '.join(unknown)} "
+                f"(choose from {', '.join(COMMANDS)})"
+            )
+        selected = {name: COMMANDS[name] for name in names}
+
+    base_env = dict(os.environ)
+    base_env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(ROOT / "src"), base_env.get("PYTHONPATH")])
+    )
+
+    run_at = datetime.now(timezone.utc).isoformat()
+    results = []
+    with tempfile.TemporaryDirectory(prefix="apexhq-bench-") as tmp:
+        tmp_dir = Path(tmp)
+        bench_sources = tmp_dir / "sources.json"
+        bench_sources.write_text(json.dumps(BENCH_SOURCES), encoding="utf-8")
+        for name, command_args in selected.items():
+            env = dict(base_env)
+            env["APEXHQ_CONFIG_CACHE"] = str(tmp_dir / f"{name}.snapshot.json")
+            if name in USES_BENCH_SOURCES:
+                env["APEXHQ_SOURCES_FILE"] = str(bench_sources)
+            try:
+                measured = bench_command(name, command_args, args.runs, env)
+            except RuntimeError as exc:
+                print(f"{name}: {exc}", file=sys.stderr)
+                return 1
+            result = {"run_at": run_at, **measured}
+            results.append(result)
+            print(
+                f"{name:14s} wall={result['wall_ms_median']:8.2f}ms "
+                f"imports={result['import_ms_median']:8.2f}ms "
+                f"heavy={','.join(result['heavy_modules']) or '-'}"
+            )
+
+    if not args.no_write:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with output.open("a", encoding="utf-8") as handle:
+            for result in results:
+                handle.write(json.dumps(result, ensure_ascii=True) + "\n")
+
+    if args.max_import_ms is not None and any(
+        r["import_ms_median"] > args.max_import_ms for r in results
+    ):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
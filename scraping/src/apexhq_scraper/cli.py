@@ -7,8 +7,13 @@ import logging
 from pathlib import Path
 from typing import Iterable
 
-from .config import Settings, load_settings, load_sources
-from .pipeline import run_pipeline
+from .config import (
+    Settings,
+    build_source_configs,
+    filter_source_entries,
+    load_settings,
+    load_source_entries,
+)
 
 logger = logging.getLogger("apexhq_scraper.cli")
 
@@ -35,6 +40,7 @@ def _apply_overrides(settings: Settings, args: argparse.Namespace) -> Settings:
             respect_robots=settings.respect_robots,
             log_json=settings.log_json,
             max_requests=settings.max_requests,
+            config_cache_file=settings.config_cache_file,
         )
     return settings
 
@@ -52,22 +58,23 @@ def main(argv: Iterable[str] | None = None) -> int:
     args = parser.parse_args(list(argv) if argv is not None else None)
 
     settings = _apply_overrides(load_settings(), args)
-    sources = load_sources(
-        settings.sources_file,
+    entries = filter_source_entries(
+        load_source_entries(settings.sources_file, settings.config_cache_file),
         only=_split_csv(args.sources),
         include_disabled=args.include_disabled,
+        reputable_only=not args.allow_unverified,
     )
 
-    if not args.allow_unverified:
-        sources = [s for s in sources if s.is_reputable]
-
     if args.list_sources:
-        for source in sources:
-            print(source.name)
+        for entry in entries:
+            print(entry.name)
         return 0
 
-    if not sources:
+    if not entries:
         print("No sources enabled. Update config/sources.json or use --include-disabled.")
         return 1
 
-    return run_pipeline(settings, sources, dry_run=args.dry_run)
+    # Deferred so listing and early exits skip requests/urllib3/pydantic.
+    from .pipeline import run_pipeline
+
+    return run_pipeline(settings, build_source_configs(entries), dry_run=args.dry_run)
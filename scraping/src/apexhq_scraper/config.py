@@ -2,38 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable
+from typing import TYPE_CHECKING, Any, Iterable
 
-from pydantic import BaseModel, Field
+from . import __version__
 
+if TYPE_CHECKING:
+    from .schema import SourceConfig
 
-class SourceEndpoint(BaseModel):
-    path: str
-    method: str = "GET"
-    params: dict[str, Any] = Field(default_factory=dict)
-
-
-class SourceConfig(BaseModel):
-    name: str
-    type: str
-    base_url: str
-    enabled: bool = False
-    reputation: str = Field(
-        default="reputable", description="reputable or nonreputable lead source"
-    )
-    endpoints: list[SourceEndpoint] = Field(default_factory=list)
-
-    @property
-    def is_reputable(self) -> bool:
-        return self.reputation.lower().strip() == "reputable"
-
-
-class SourcesFile(BaseModel):
-    sources: list[SourceConfig]
+# Bump whenever schema.py changes what validation accepts or produces, so
+# config snapshots written against the old schema are revalidated. Kept here
+# rather than in schema.py so checking a snapshot does not import pydantic.
+SCHEMA_VERSION = 1
 
 
 @dataclass(frozen=True)
@@ -51,6 +35,7 @@ class Settings:
     respect_robots: bool
     log_json: bool
     max_requests: int | None
+    config_cache_file: Path | None = None
 
 
 def project_root() -> Path:
@@ -71,6 +56,13 @@ def load_settings() -> Settings:
     output_dir = Path(os.getenv("APEXHQ_OUTPUT_DIR", root / "output"))
     cache_dir_value = os.getenv("APEXHQ_CACHE_DIR")
     cache_dir = Path(cache_dir_value) if cache_dir_value else None
+    config_cache_value = os.getenv("APEXHQ_CONFIG_CACHE")
+    if config_cache_value is None:
+        config_cache_file: Path | None = (
+            (cache_dir or root / "cache") / "sources.snapshot.json"
+        )
+    else:
+        config_cache_file = Path(config_cache_value) if config_cache_value.strip() else None
     return Settings(
         sources_file=sources_file,
         output_dir=output_dir,
@@ -87,6 +79,7 @@ def load_settings() -> Settings:
         respect_robots=_env_bool(os.getenv("APEXHQ_RESPECT_ROBOTS"), True),
         log_json=_env_bool(os.getenv("APEXHQ_LOG_JSON"), False),
         max_requests=_env_int_optional(os.getenv("APEXHQ_MAX_REQUESTS")),
+        config_cache_file=config_cache_file,
     )
 
 
@@ -96,14 +89,139 @@ def _env_int_optional(value: str | None) -> int | None:
     return int(value)
 
 
-def load_sources(
-    sources_file: Path, only: Iterable[str] | None = None, include_disabled: bool = False
-) -> list[SourceConfig]:
-    data = json.loads(sources_file.read_text(encoding="utf-8"))
-    sources = SourcesFile.model_validate(data).sources
+def _read_snapshot(cache_file: Path, sources_path: str) -> dict[str, Any] | None:
+    try:
+        snapshot = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or not isinstance(snapshot.get("sources"), list):
+        return None
+    if (
+        snapshot.get("version") != __version__
+        or snapshot.get("sources_file") != sources_path
+        or snapshot.get("schema_version") != SCHEMA_VERSION
+    ):
+        return None
+    return snapshot
+
+
+def _write_snapshot(cache_file: Path, snapshot: dict[str, Any]) -> None:
+    tmp_path = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(snapshot, ensure_ascii=True), encoding="utf-8")
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+@dataclass
+class SourceEntry:
+    """A validated source: snapshot data, plus the model when already built."""
+
+    data: dict[str, Any]
+    config: SourceConfig | None = None
+
+    @property
+    def name(self) -> str:
+        return self.data["name"]
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.data.get("enabled"))
+
+    @property
+    def is_reputable(self) -> bool:
+        return str(self.data.get("reputation", "reputable")).lower().strip() == "reputable"
+
+
+def load_source_entries(
+    sources_file: Path, cache_file: Path | None = None
+) -> list[SourceEntry]:
+    """Return validated source entries.
+
+    With a cache file, the validated snapshot is reused while the sources
+    file's path, mtime and size (or, failing that, its sha256) and
+    SCHEMA_VERSION are unchanged, so pydantic is only imported when the file
+    actually needs validating. Entries validated by this call keep their
+    models so they are not validated again.
+    """
+    stat = sources_file.stat()
+    sources_path = str(sources_file.resolve())
+    snapshot = _read_snapshot(cache_file, sources_path) if cache_file else None
+    if (
+        snapshot
+        and snapshot.get("mtime_ns") == stat.st_mtime_ns
+        and snapshot.get("size") == stat.st_size
+    ):
+        return [SourceEntry(data) for data in snapshot["sources"]]
+
+    raw = sources_file.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if snapshot and snapshot.get("sha256") == digest:
+        entries = [SourceEntry(data) for data in snapshot["sources"]]
+    else:
+        from .schema import SourcesFile
+
+        validated = SourcesFile.model_validate(json.loads(raw.decode("utf-8")))
+        entries = [
+            SourceEntry(source.model_dump(mode="json"), source)
+            for source in validated.sources
+        ]
+
+    if cache_file:
+        _write_snapshot(
+            cache_file,
+            {
+                "version": __version__,
+                "sources_file": sources_path,
+                "schema_version": SCHEMA_VERSION,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": digest,
+                "sources": [entry.data for entry in entries],
+            },
+        )
+    return entries
+
+
+def filter_source_entries(
+    entries: Iterable[SourceEntry],
+    only: Iterable[str] | None = None,
+    include_disabled: bool = False,
+    reputable_only: bool = False,
+) -> list[SourceEntry]:
+    selected = list(entries)
     if only:
         names = {name.strip() for name in only if name.strip()}
-        sources = [source for source in sources if source.name in names]
+        selected = [entry for entry in selected if entry.name in names]
     if not include_disabled:
-        sources = [source for source in sources if source.enabled]
-    return sources
+        selected = [entry for entry in selected if entry.enabled]
+    if reputable_only:
+        selected = [entry for entry in selected if entry.is_reputable]
+    return selected
+
+
+def build_source_configs(entries: Iterable[SourceEntry]) -> list[SourceConfig]:
+    from .schema import SourceConfig
+
+    configs: list[SourceConfig] = []
+    for entry in entries:
+        if entry.config is None:
+            entry.config = SourceConfig.model_validate(entry.data)
+        configs.append(entry.config)
+    return configs
+
+
+def load_sources(
+    sources_file: Path,
+    only: Iterable[str] | None = None,
+    include_disabled: bool = False,
+    cache_file: Path | None = None,
+) -> list[SourceConfig]:
+    entries = filter_source_entries(
+        load_source_entries(sources_file, cache_file),
+        only=only,
+        include_disabled=include_disabled,
+    )
+    return build_source_configs(entries)
@@ -7,11 +7,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable
 
-from .config import Settings, SourceConfig
+from .config import Settings
 from .http_client import HttpClient, ResponseCache
 from .logging_utils import configure_logging
 from .rate_limit import RateLimiter
 from .robots import RobotsCache
+from .schema import SourceConfig
 from .sources import build_source
 from .storage import JsonlSink, NullSink, StorageSink
 
@@ -0,0 +1,77 @@
+"""Validation schema for the sources config file."""
+
+from __future__ import annotations
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field, model_validator
+
+from .models import LegendPickRate, MapLegendPriority
+
+RECORD_MODELS: dict[str, type[BaseModel]] = {
+    "legend_pick_rate": LegendPickRate,
+    "map_legend_priority": MapLegendPriority,
+}
+
+
+class ExtractField(BaseModel):
+    selector: str | None = Field(
+        default=None, description="CSS selector relative to the item node"
+    )
+    attr: str | None = Field(
+        default=None, description="attribute to read instead of the node text"
+    )
+    value: Any = Field(default=None, description="constant used when no selector is set")
+    kind: Literal["text", "float", "percent"] = "text"
+
+
+class ExtractSpec(BaseModel):
+    record: Literal["legend_pick_rate", "map_legend_priority"]
+    root: str | None = Field(
+        default=None, description="CSS selector for the subtree holding the items"
+    )
+    item: str = Field(description="CSS selector for one record within the root")
+    fields: dict[str, ExtractField]
+
+    @model_validator(mode="after")
+    def _check_fields(self) -> ExtractSpec:
+        model_fields = RECORD_MODELS[self.record].model_fields
+        unknown = sorted(set(self.fields) - set(model_fields))
+        if unknown:
+            raise ValueError(f"unknown fields for {self.record}: {', '.join(unknown)}")
+        missing = sorted(
+            name
+            for name, info in model_fields.items()
+            if info.is_required() and name not in self.fields
+        )
+        if missing:
+            raise ValueError(
+                f"missing required fields for {self.record}: {', '.join(missing)}"
+            )
+        return self
+
+
+class SourceEndpoint(BaseModel):
+    path: str
+    method: str = "GET"
+    params: dict[str, Any] = Field(default_factory=dict)
+    extract: ExtractSpec | None = None
+
+
+class SourceConfig(BaseModel):
+    name: str
+    type: str
+    base_url: str
+    enabled: bool = False
+    reputation: str = Field(
+        default="reputable", description="reputable or nonreputable lead source"
+    )
+    endpoints: list[SourceEndpoint] = Field(default_factory=list)
+
+    @property
+    def is_reputable(self) -> bool:
+        return self.reputation.lower().strip() == "reputable"
+
+
+class SourcesFile(BaseModel):
+    sources: list[SourceConfig]
@@ -8,9 +8,10 @@ from datetime import datetime, timezone
 from typing import Any
 from urllib.parse import urljoin
 
-from ..config import SourceConfig, SourceEndpoint
 from ..http_client import FetchResult, HttpClient
 from ..models import RawRecord
+from ..schema import SourceConfig, SourceEndpoint
+from .extract import CompiledExtractor
 
 
 @dataclass
@@ -68,16 +69,41 @@ class HttpJsonSource(Source):
 
 
 class HttpHtmlSource(Source):
+    def __init__(self, config: SourceConfig) -> None:
+        super().__init__(config)
+        self._extractors: list[CompiledExtractor] = []
+
+    def _extractor_for(self, endpoint: SourceEndpoint) -> CompiledExtractor | None:
+        if endpoint.extract is None:
+            return None
+        # Compared by value so copied or re-validated endpoints still match.
+        for extractor in self._extractors:
+            if extractor.spec == endpoint.extract:
+                return extractor
+        # Compiled on first use so a bad selector only fails its own endpoint.
+        extractor = CompiledExtractor(endpoint.extract)
+        self._extractors.append(extractor)
+        return extractor
+
     def parse(self, result: FetchResult, endpoint: SourceEndpoint) -> list[RawRecord]:
-        payload: dict[str, Any] = {"html": result.text}
+        extractor = self._extractor_for(endpoint)
+        if extractor is None:
+            payloads: list[Any] = [{"html": result.text}]
+        else:
+            payloads = [
+                {"type": extractor.spec.record, **item.model_dump()}
+                for item in extractor.extract(result.text)
+            ]
+        fetched_at = datetime.now(timezone.utc)
         return [
             RawRecord(
                 source=self.name,
                 source_url=result.url,
                 reputation="reputable" if self.is_reputable else "nonreputable",
                 verified=self.is_reputable,
-                fetched_at=datetime.now(timezone.utc),
+                fetched_at=fetched_at,
                 endpoint=endpoint.path,
                 payload=payload,
             )
+            for payload in payloads
         ]
@@ -0,0 +1,195 @@
+"""Compiled CSS extraction for HTML sources."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+from ..schema import RECORD_MODELS, ExtractSpec
+
+_SIMPLE_SELECTOR = re.compile(
+    r"^(?P<tag>[a-zA-Z][\w-]*)?(?:#(?P<id>[\w-]+)|\.(?P<cls>[\w-]+))?$"
+)
+_NUMBER = re.compile(r"-?\d(?:[\d.,]*\d)?")
+_PLAIN_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+_GROUPED_NUMBER = re.compile(r"-?\d{1,3}(?:,\d{3})+(?:\.\d+)?")
+_DECIMAL_COMMA = re.compile(r"-?\d+,\d{1,2}")
+
+
+def _to_float(raw: str) -> float | None:
+    """Parse the first number in ``raw``; ambiguous separators yield ``None``."""
+    match = _NUMBER.search(raw)
+    if not match:
+        return None
+    token = match.group(0)
+    if _PLAIN_NUMBER.fullmatch(token):
+        return float(token)
+    if _GROUPED_NUMBER.fullmatch(token):
+        return float(token.replace(",", ""))
+    if _DECIMAL_COMMA.fullmatch(token):
+        return float(token.replace(",", "."))
+    return None
+
+
+def _convert(raw: str | None, kind: str) -> Any:
+    if raw is None:
+        return None
+    raw = raw.strip()
+    if not raw:
+        return None
+    if kind == "float":
+        return _to_float(raw)
+    if kind == "percent":
+        number = _to_float(raw)
+        return None if number is None else number / 100.0
+    return raw
+
+
+@lru_cache(maxsize=1)
+def fast_backend_available() -> bool:
+    try:
+        import selectolax.lexbor  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=1)
+def _bs4_parser_name() -> str:
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
+
+
+@dataclass(frozen=True)
+class _CompiledField:
+    name: str
+    selector: str | None
+    attr: str | None
+    value: Any
+    kind: str
+    matcher: Any = None
+
+
+class CompiledExtractor:
+    """Extraction spec resolved once and reused for every page of an endpoint."""
+
+    def __init__(self, spec: ExtractSpec, use_fast_backend: bool | None = None) -> None:
+        self.spec = spec
+        self.model = RECORD_MODELS[spec.record]
+        if use_fast_backend is None:
+            use_fast_backend = fast_backend_available()
+        self.backend = "selectolax" if use_fast_backend else "bs4"
+
+        compile_selector: Callable[[str], Any] = lambda selector: None
+        if not use_fast_backend:
+            import soupsieve
+
+            compile_selector = soupsieve.compile
+        self.fields = [
+            _CompiledField(
+                name=name,
+                selector=field.selector,
+                attr=field.attr,
+                value=field.value,
+                kind=field.kind,
+                matcher=compile_selector(field.selector) if field.selector else None,
+            )
+            for name, field in spec.fields.items()
+        ]
+        self._root_matcher = compile_selector(spec.root) if spec.root else None
+        self._item_matcher = compile_selector(spec.item)
+        self._strainer_kwargs = self._strainer_for(spec.root)
+        self._extract: Callable[[str], list[dict[str, Any]]] = (
+            self._extract_selectolax if use_fast_backend else self._extract_bs4
+        )
+
+    @staticmethod
+    def _strainer_for(root: str | None) -> dict[str, Any] | None:
+        if not root:
+            return None
+        match = _SIMPLE_SELECTOR.match(root.strip())
+        if not match or not any(match.groupdict().values()):
+            return None
+        attrs: dict[str, str] = {}
+        if match.group("id"):
+            attrs["id"] = match.group("id")
+        if match.group("cls"):
+            attrs["class"] = match.group("cls")
+        return {"name": match.group("tag"), "attrs": attrs}
+
+    def extract(self, html: str) -> list[BaseModel]:
+        rows = self._extract(html)
+        if not rows:
+            raise ValueError(
+                f"extract spec matched no items (root={self.spec.root!r}, item={self.spec.item!r})"
+            )
+        return [self.model.model_validate(values) for values in rows]
+
+    def _row(
+        self, item: Any, read: Callable[[Any, _CompiledField], str | None]
+    ) -> dict[str, Any]:
+        values: dict[str, Any] = {}
+        for field in self.fields:
+            if field.selector is None:
+                values[field.name] = field.value
+            else:
+                values[field.name] = _convert(read(item, field), field.kind)
+        return values
+
+    def _extract_selectolax(self, html: str) -> list[dict[str, Any]]:
+        from selectolax.lexbor import LexborHTMLParser
+
+        # Lexbor has no partial parse: the whole page is parsed and only the
+        # root's subtree is queried.
+        tree = LexborHTMLParser(html)
+        if self.spec.root is None:
+            root = tree.root
+            if root is None:
+                return []
+            items = root.css(self.spec.item)
+        else:
+            root = tree.css_first(self.spec.root)
+            if root is None:
+                return []
+            # Node.css can match the root itself; soupsieve only matches
+            # descendants, so drop it to keep both backends in agreement.
+            items = [item for item in root.css(self.spec.item) if item != root]
+        return [self._row(item, _read_selectolax) for item in items]
+
+    def _extract_bs4(self, html: str) -> list[dict[str, Any]]:
+        from bs4 import BeautifulSoup, SoupStrainer
+
+        parse_only = None
+        if self._strainer_kwargs is not None:
+            parse_only = SoupStrainer(**self._strainer_kwargs)
+        soup = BeautifulSoup(html, _bs4_parser_name(), parse_only=parse_only)
+        root = self._root_matcher.select_one(soup) if self._root_matcher else soup
+        if root is None:
+            return []
+        return [self._row(item, _read_bs4) for item in self._item_matcher.select(root)]
+
+
+def _read_selectolax(item: Any, field: _CompiledField) -> str | None:
+    node = item.css_first(field.selector)
+    if node is None:
+        return None
+    if field.attr:
+        return node.attributes.get(field.attr)
+    return node.text(strip=True)
+
+
+def _read_bs4(item: Any, field: _CompiledField) -> str | None:
+    node = field.matcher.select_one(item)
+    if node is None:
+        return None
+    if field.attr:
+        value = node.get(field.attr)
+        return " ".join(value) if isinstance(value, list) else value
+    return node.get_text(strip=True)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from ..config import SourceConfig
+from ..schema import SourceConfig
 from .base import HttpHtmlSource, HttpJsonSource, Source
 
 
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from apexhq_scraper import config, schema
+from apexhq_scraper.config import (
+    SourceEntry,
+    build_source_configs,
+    load_settings,
+    load_source_entries,
+)
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+PINNED_SCHEMA_DIGEST = "8fe356052c097161e1bc68924c3ae3897faef96e17ea9fb7b69bffe6f0bf2c7a"
+
+
+def _write_sources(path: Path, *names: str) -> None:
+    sources = [
+        {"name": name, "type": "http_html", "base_url": "https://example.com", "enabled": True}
+        for name in names
+    ]
+    path.write_text(json.dumps({"sources": sources}), encoding="utf-8")
+
+
+@pytest.fixture
+def validations(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls: list[int] = []
+    original = schema.SourcesFile.model_validate
+
+    def counting(data: object) -> schema.SourcesFile:
+        calls.append(1)
+        return original(data)
+
+    monkeypatch.setattr(schema.SourcesFile, "model_validate", counting)
+    return calls
+
+
+def _names(entries: list[SourceEntry]) -> list[str]:
+    return [entry.name for entry in entries]
+
+
+def test_snapshot_reused_while_file_unchanged(tmp_path: Path, validations: list[int]) -> None:
+    sources, cache = tmp_path / "sources.json", tmp_path / "snapshot.json"
+    _write_sources(sources, "alpha")
+
+    first = load_source_entries(sources, cache)
+    second = load_source_entries(sources, cache)
+
+    assert _names(first) == _names(second) == ["alpha"]
+    assert first[0].data["reputation"] == "reputable"
+    assert len(validations) == 1
+
+
+def test_cold_load_does_not_revalidate_configs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sources, cache = tmp_path / "sources.json", tmp_path / "snapshot.json"
+    _write_sources(sources, "alpha")
+    entries = load_source_entries(sources, cache)
+
+    def fail(data: object) -> None:
+        raise AssertionError("SourceConfig validated twice")
+
+    monkeypatch.setattr(schema.SourceConfig, "model_validate", fail)
+    assert [config.name for config in build_source_configs(entries)] == ["alpha"]
+
+
+def test_warm_load_builds_configs_from_snapshot(tmp_path: Path) -> None:
+    sources, cache = tmp_path / "sources.json", tmp_path / "snapshot.json"
+    _write_sources(sources, "alpha")
+    load_source_entries(sources, cache)
+
+    entries = load_source_entries(sources, cache)
+
+    assert entries[0].config is None
+    assert [config.name for config in build_source_configs(entries)] == ["alpha"]
+
+
+def test_touched_file_falls_back_to_sha256(tmp_path: Path, validations: list[int]) -> None:
+    sources, cache = tmp_path / "sources.json", tmp_path / "snapshot.json"
+    _write_sources(sources, "alpha")
+    load_source_entries(sources, cache)
+
+    stat = sources.stat()
+    os.utime(sources, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert _names(load_source_entries(sources, cache)) == ["alpha"]
+    assert len(validations) == 1
+    snapshot = json.loads(cache.read_text(encoding="utf-8"))
+    assert snapshot["mtime_ns"] == sources.stat().st_mtime_ns
+
+
+def test_changed_content_is_revalidated(tmp_path: Path, validations: list[int]) -> None:
+    sources, cache = tmp_path / "sources.json", tmp_path / "snapshot.json"
+    _write_sources(sources, "alpha")
+    load_source_entries(sources, cache)
+
+    _write_sources(sources, "bravo", "charlie")
+
+    assert _names(load_source_entries(sources, cache)) == ["bravo", "charlie"]
+    assert len(validations) == 2
+
+
+def test_corrupt_snapshot_is_rebuilt(tmp_path: Path, validations: list[int]) -> None:
+    sources, cache = tmp_path / "sources.json", tmp_path / "snapshot.json"
+    _write_sources(sources, "alpha")
+    cache.write_text("{not json", encoding="utf-8")
+
+    assert _names(load_source_entries(sources, cache)) == ["alpha"]
+    assert len(validations) == 1
+    assert json.loads(cache.read_text(encoding="utf-8"))["sources"][0]["name"] == "alpha"
+
+
+def test_snapshot_not_shared_between_sources_files(tmp_path: Path) -> None:
+    first, second = tmp_path / "first.json", tmp_path / "second.json"
+    cache = tmp_path / "snapshot.json"
+    _write_sources(first, "alpha")
+    _write_sources(second, "bravo")
+    stat = first.stat()
+    os.utime(second, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert _names(load_source_entries(first, cache)) == ["alpha"]
+    assert _names(load_source_entries(second, cache)) == ["bravo"]
+
+
+def test_schema_change_invalidates_snapshot(
+    tmp_path: Path, validations: list[int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sources, cache = tmp_path / "sources.json", tmp_path / "snapshot.json"
+    _write_sources(sources, "alpha")
+    load_source_entries(sources, cache)
+
+    monkeypatch.setattr(config, "SCHEMA_VERSION", config.SCHEMA_VERSION + 1)
+
+    load_source_entries(sources, cache)
+    assert len(validations) == 2
+
+
+def test_schema_version_matches_schema() -> None:
+    # If this fails, schema.py changed: bump config.SCHEMA_VERSION and update
+    # the pinned version and digest together.
+    models = (
+        schema.ExtractField,
+        schema.ExtractSpec,
+        schema.SourceEndpoint,
+        schema.SourceConfig,
+        schema.SourcesFile,
+    )
+    shape = [
+        [model.__name__, name, str(info.annotation), repr(info.default)]
+        for model in models
+        for name, info in model.model_fields.items()
+    ]
+    digest = hashlib.sha256(json.dumps(shape).encode("utf-8")).hexdigest()
+    assert (config.SCHEMA_VERSION, digest) == (1, PINNED_SCHEMA_DIGEST)
+
+
+def test_invalid_extract_spec_is_not_snapshotted(tmp_path: Path) -> None:
+    sources, cache = tmp_path / "sources.json", tmp_path / "snapshot.json"
+    endpoint = {"path": "/", "extract": {"record": "legend_pick_rate", "item": "tr", "fields": {}}}
+    source = {"name": "alpha", "type": "http_html", "base_url": "", "endpoints": [endpoint]}
+    sources.write_text(json.dumps({"sources": [source]}), encoding="utf-8")
+
+    with pytest.raises(ValidationError, match="missing required fields"):
+        load_source_entries(sources, cache)
+    assert not cache.exists()
+
+
+def test_no_cache_file_always_validates(tmp_path: Path, validations: list[int]) -> None:
+    sources = tmp_path / "sources.json"
+    _write_sources(sources, "alpha")
+
+    load_source_entries(sources, None)
+    load_source_entries(sources, None)
+
+    assert len(validations) == 2
+    assert list(tmp_path.iterdir()) == [sources]
+
+
+def test_config_cache_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("APEXHQ_CONFIG_CACHE", "")
+    assert load_settings().config_cache_file is None
+
+    monkeypatch.setenv("APEXHQ_CONFIG_CACHE", str(tmp_path / "snap.json"))
+    assert load_settings().config_cache_file == tmp_path / "snap.json"
+
+    monkeypatch.delenv("APEXHQ_CONFIG_CACHE")
+    monkeypatch.setenv("APEXHQ_CACHE_DIR", str(tmp_path))
+    assert load_settings().config_cache_file == tmp_path / "sources.snapshot.json"
+
+
+def test_list_sources_with_warm_snapshot_skips_heavy_imports(tmp_path: Path) -> None:
+    sources = tmp_path / "sources.json"
+    _write_sources(sources, "alpha")
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(SRC_DIR),
+        "APEXHQ_SOURCES_FILE": str(sources),
+        "APEXHQ_CONFIG_CACHE": str(tmp_path / "snapshot.json"),
+    }
+    script = (
+        "import json, sys\n"
+        "from apexhq_scraper.cli import main\n"
+        "code = main(['--list-sources'])\n"
+        "heavy = ('pydantic', 'requests', 'urllib3', 'bs4')\n"
+        "print(json.dumps([code, sorted(m for m in heavy if m in sys.modules)]))\n"
+    )
+
+    def run() -> list:
+        completed = subprocess.run(
+            [sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True
+        )
+        return json.loads(completed.stdout.splitlines()[-1])
+
+    assert run() == [0, ["pydantic"]]
+    assert run() == [0, []]
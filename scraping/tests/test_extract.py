@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from apexhq_scraper.http_client import FetchResult
+from apexhq_scraper.models import LegendPickRate
+from apexhq_scraper.schema import ExtractSpec, SourceConfig
+from apexhq_scraper.sources import HttpHtmlSource
+from apexhq_scraper.sources import extract
+from apexhq_scraper.sources.extract import CompiledExtractor, _convert, fast_backend_available
+
+BACKENDS = [
+    pytest.param(False, id="bs4"),
+    pytest.param(
+        True,
+        id="selectolax",
+        marks=pytest.mark.skipif(
+            not fast_backend_available(), reason="selectolax not installed"
+        ),
+    ),
+]
+
+PAGE = """
+<html><body>
+<table id="decoy"><tr><td class="legend">Decoy</td><td class="rate">99%</td></tr></table>
+<table id="pick-rates">
+  <tr><td class="legend" data-region="EU">Wraith</td><td class="rate">12.5%</td></tr>
+  <tr><td class="legend">Bangalore</td><td class="rate">1,5 %</td></tr>
+</table>
+</body></html>
+"""
+
+SPEC = {
+    "record": "legend_pick_rate",
+    "root": "table#pick-rates",
+    "item": "tr",
+    "fields": {
+        "legend": {"selector": "td.legend"},
+        "pick_rate": {"selector": "td.rate", "kind": "percent"},
+        "window": {"value": "7d"},
+        "region": {"selector": "td.legend", "attr": "data-region"},
+    },
+}
+
+EXPECTED = [
+    LegendPickRate(legend="Wraith", pick_rate=0.125, window="7d", region="EU"),
+    LegendPickRate(legend="Bangalore", pick_rate=0.015, window="7d", region=None),
+]
+
+
+@pytest.mark.parametrize("fast", BACKENDS)
+def test_extracts_records_within_root(fast: bool) -> None:
+    extractor = CompiledExtractor(ExtractSpec.model_validate(SPEC), use_fast_backend=fast)
+    assert extractor.extract(PAGE) == EXPECTED
+
+
+NESTED_PAGE = """
+<div id="stats" class="row">
+  <div class="row"><span class="legend">Wraith</span><span class="rate">10%</span></div>
+</div>
+"""
+
+NESTED_SPEC = {
+    "record": "legend_pick_rate",
+    "root": "#stats",
+    "item": "div.row",
+    "fields": {
+        "legend": {"selector": "span.legend"},
+        "pick_rate": {"selector": "span.rate", "kind": "percent"},
+        "window": {"value": "7d"},
+    },
+}
+
+
+@pytest.mark.parametrize(
+    ("spec", "page", "count"),
+    [
+        pytest.param(SPEC, PAGE, 2, id="table"),
+        pytest.param(NESTED_SPEC, NESTED_PAGE, 1, id="item-matches-root"),
+    ],
+)
+def test_backends_agree(spec: dict, page: str, count: int) -> None:
+    if not fast_backend_available():
+        pytest.skip("selectolax not installed")
+    compiled = ExtractSpec.model_validate(spec)
+    fast = CompiledExtractor(compiled, use_fast_backend=True).extract(page)
+    slow = CompiledExtractor(compiled, use_fast_backend=False).extract(page)
+    assert fast == slow
+    assert len(fast) == count
+
+
+@pytest.mark.parametrize("fast", BACKENDS)
+def test_no_matching_items_is_an_error(fast: bool) -> None:
+    spec = ExtractSpec.model_validate({**SPEC, "item": "li"})
+    with pytest.raises(ValueError, match="matched no items"):
+        CompiledExtractor(spec, use_fast_backend=fast).extract(PAGE)
+
+
+@pytest.mark.parametrize("fast", BACKENDS)
+def test_missing_root_is_an_error(fast: bool) -> None:
+    spec = ExtractSpec.model_validate({**SPEC, "root": "table#missing"})
+    with pytest.raises(ValueError, match="matched no items"):
+        CompiledExtractor(spec, use_fast_backend=fast).extract(PAGE)
+
+
+def test_strainer_only_for_simple_root_selectors() -> None:
+    assert CompiledExtractor._strainer_for("table#pick-rates") == {
+        "name": "table",
+        "attrs": {"id": "pick-rates"},
+    }
+    assert CompiledExtractor._strainer_for(".stats") == {
+        "name": None,
+        "attrs": {"class": "stats"},
+    }
+    assert CompiledExtractor._strainer_for("div > table") is None
+    assert CompiledExtractor._strainer_for(None) is None
+
+
+@pytest.mark.parametrize(
+    ("raw", "kind", "expected"),
+    [
+        ("Wraith ", "text", "Wraith"),
+        ("", "text", None),
+        ("1,234.5", "float", 1234.5),
+        ("12,345,678", "float", 12345678.0),
+        ("12,5", "float", 12.5),
+        ("-3", "float", -3.0),
+        ("12.5%", "percent", 0.125),
+        ("1.234,5", "float", None),
+        ("1,2345", "float", None),
+        ("1.2.3", "float", None),
+        ("n/a", "percent", None),
+    ],
+)
+def test_convert(raw: str, kind: str, expected: object) -> None:
+    assert _convert(raw, kind) == expected
+
+
+def test_unknown_field_rejected_by_schema() -> None:
+    fields = {**SPEC["fields"], "regoin": {"selector": "td"}}
+    with pytest.raises(ValidationError, match="unknown fields.*regoin"):
+        ExtractSpec.model_validate({**SPEC, "fields": fields})
+
+
+def test_missing_required_field_rejected_by_schema() -> None:
+    fields = {"legend": {"selector": "td.legend"}}
+    with pytest.raises(ValidationError, match="missing required fields.*pick_rate, window"):
+        ExtractSpec.model_validate({**SPEC, "fields": fields})
+
+
+def _source(extract: dict | None) -> SourceConfig:
+    endpoint: dict = {"path": "/stats"}
+    if extract is not None:
+        endpoint["extract"] = extract
+    return SourceConfig.model_validate(
+        {
+            "name": "stats",
+            "type": "http_html",
+            "base_url": "https://example.com",
+            "reputation": "reputable",
+            "endpoints": [endpoint],
+        }
+    )
+
+
+def test_parse_emits_structured_records() -> None:
+    config = _source(SPEC)
+    source = HttpHtmlSource(config)
+    result = FetchResult(url="https://example.com/stats", status_code=200, headers={}, text=PAGE)
+
+    # A copied endpoint must still resolve to its compiled extractor.
+    records = source.parse(result, config.endpoints[0].model_copy(deep=True))
+
+    assert [record.payload for record in records] == [
+        {"type": "legend_pick_rate", **item.model_dump()} for item in EXPECTED
+    ]
+    assert all(record.source_url == result.url and record.verified for record in records)
+
+
+def test_parse_without_spec_keeps_raw_html() -> None:
+    config = _source(None)
+    source = HttpHtmlSource(config)
+    result = FetchResult(url="https://example.com/stats", status_code=200, headers={}, text=PAGE)
+
+    records = source.parse(result, config.endpoints[0])
+
+    assert [record.payload for record in records] == [{"html": PAGE}]
+
+
+class _StaticClient:
+    def get(self, url: str, params: dict | None = None) -> FetchResult:
+        return FetchResult(url=url, status_code=200, headers={}, text=PAGE)
+
+
+@pytest.mark.parametrize("fast", BACKENDS)
+def test_bad_selector_fails_only_its_endpoint(
+    fast: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(extract, "fast_backend_available", lambda: fast)
+    config = _source(SPEC)
+    broken = {**SPEC, "fields": {**SPEC["fields"], "legend": {"selector": "td[["}}}
+    config.endpoints.append(
+        config.endpoints[0].model_copy(
+            update={"path": "/broken", "extract": ExtractSpec.model_validate(broken)}
+        )
+    )
+
+    result = HttpHtmlSource(config).run(_StaticClient())  # type: ignore[arg-type]
+
+    assert [record.payload["legend"] for record in result.records] == ["Wraith", "Bangalore"]
+    assert len(result.errors) == 1 and result.errors[0].startswith("stats:/broken:")